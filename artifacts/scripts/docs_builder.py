@@ -7,7 +7,11 @@ It creates a build folder with index.html and linked pages for requirements and
 """
 
 import os
+import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Check if running in docs_venv, if not, restart in venv
@@ -17,9 +21,9 @@ if venv_python.exists() and sys.executable != str(venv_python):
     result = subprocess.run([str(venv_python), __file__], check=False)
     sys.exit(result.returncode)
 
-import yaml
-import requests
-import shutil
+import base64
+import hashlib
+import threading
 import zlib
 
 
@@ -70,9 +74,14 @@ def validate_requirement_list(data, label, required_keys, add_error):
 
 def load_yaml(file_path):
     """Load YAML file content."""
+    # Imported lazily so startup stays cheap when there is nothing to build
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=loader)
     except Exception as e:
         log_error(f"Failed to load YAML '{file_path}': {e}")
         return None
@@ -88,42 +97,91 @@ def load_puml(file_path):
         return None
 
 
+_PLANTUML_TRANSLATION = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",
+    b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_",
+)
+
+# Raw DEFLATE (no zlib header) is required; wbits=-15 turns off headers/checksums.
+# Level 6 is zlib's default; level 9 costs noticeably more CPU for almost no gain on PUML text.
+# This compressor is never fed directly; each encode works on a fresh copy of it.
+_PLANTUML_COMPRESSOR = zlib.compressobj(level=6, wbits=-zlib.MAX_WBITS)
+
+
+@lru_cache(maxsize=128)
 def _plantuml_encode(puml_text: str) -> str:
     """Encode PlantUML text using the official deflate + 6-bit algorithm."""
-    # Raw DEFLATE (no zlib header) is required; wbits=-15 turns off headers/checksums
-    compressor = zlib.compressobj(level=9, wbits=-zlib.MAX_WBITS)
+    compressor = _PLANTUML_COMPRESSOR.copy()
     compressed = compressor.compress(puml_text.encode("utf-8")) + compressor.flush()
 
-    alphabet = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_"
-    encoded_chars = []
+    # PlantUML's 6-bit encoding is base64 with its own alphabet and no padding
+    return base64.b64encode(compressed).rstrip(b"=").translate(_PLANTUML_TRANSLATION).decode("ascii")
+
+
+_plantuml_session = None
+_plantuml_session_lock = threading.Lock()
+
+
+def plantuml_session():
+    """Shared HTTP session so diagram requests reuse pooled connections to the PlantUML server."""
+    global _plantuml_session
+    # Diagram pages render concurrently, so create the session under a lock exactly once
+    with _plantuml_session_lock:
+        if _plantuml_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            _plantuml_session = session
+        return _plantuml_session
+
 
-    for i in range(0, len(compressed), 3):
-        b1 = compressed[i]
-        b2 = compressed[i + 1] if i + 1 < len(compressed) else 0
-        b3 = compressed[i + 2] if i + 2 < len(compressed) else 0
+def read_cached_svg(cache_path):
+    """Return a previously rendered SVG, or None if it is not cached."""
+    try:
+        return cache_path.read_text(encoding='utf-8')
+    except OSError:
+        return None
 
-        encoded_chars.append(alphabet[(b1 >> 2) & 0x3F])
-        encoded_chars.append(alphabet[((b1 & 0x03) << 4) | ((b2 >> 4) & 0x0F)])
 
-        if i + 1 < len(compressed):
-            encoded_chars.append(alphabet[((b2 & 0x0F) << 2) | ((b3 >> 6) & 0x03)])
-        if i + 2 < len(compressed):
-            encoded_chars.append(alphabet[b3 & 0x3F])
+def store_cached_svg(cache_path, svg):
+    """Store a rendered SVG; a failed write only costs a re-render next time."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        tmp_path.write_text(svg, encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        log_warning(f"Could not cache rendered diagram '{cache_path.name}': {e}")
 
-    return "".join(encoded_chars)
 
+@lru_cache(maxsize=128)
+def render_puml_to_svg(puml_text, cache_dir=None):
+    """Render PUML text to SVG using PlantUML server.
 
-def render_puml_to_svg(puml_text):
-    """Render PUML text to SVG using PlantUML server."""
+    Successful renders are stored in cache_dir under the SHA-256 of the source,
+    so unchanged diagrams are not fetched again on the next build.
+    """
     try:
         if not isinstance(puml_text, str) or not puml_text.strip():
             raise ValueError("PUML source is empty or invalid.")
 
+        cache_path = None
+        if cache_dir is not None:
+            digest = hashlib.sha256(puml_text.encode('utf-8')).hexdigest()
+            cache_path = cache_dir / f"{digest}.svg"
+            cached = read_cached_svg(cache_path)
+            if cached is not None:
+                return cached
+
         encoded = _plantuml_encode(puml_text)
         url = f"https://www.plantuml.com/plantuml/svg/{encoded}"
-        response = requests.get(url, timeout=10)
+        response = plantuml_session().get(url, timeout=10)
 
         if response.status_code == 200 and '<svg' in response.text:
+            if cache_path is not None:
+                store_cached_svg(cache_path, response.text)
             return response.text
 
         log_warning(
@@ -146,62 +204,62 @@ def render_puml_to_svg(puml_text):
         )
 
 
-def generate_html_head(title):
-    """Generate HTML head section with improved styling."""
-    return f"""<!DOCTYPE html>
+HTML_HEAD_PREFIX = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Project Documentation</title>
+    <title>"""
+
+HTML_HEAD_SUFFIX = """ - Project Documentation</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
-        body {{
+        }
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             color: #000;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background-color: white;
             min-height: 100vh;
             box-shadow: 0 0 20px rgba(0,0,0,0.1);
-        }}
-        header {{
+        }
+        header {
             background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
             color: white;
             padding: 2rem 0;
             text-align: center;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        header h1 {{
+        }
+        header h1 {
             font-size: 2.5rem;
             margin-bottom: 0.5rem;
-        }}
-        header p {{
+        }
+        header p {
             font-size: 1.2rem;
             opacity: 0.9;
-        }}
-        nav {{
+        }
+        nav {
             background-color: #f8f9fa;
             padding: 1rem 0;
             border-bottom: 1px solid #e9ecef;
-        }}
-        nav .nav-container {{
+        }
+        nav .nav-container {
             max-width: 1200px;
             margin: 0 auto;
             display: flex;
             justify-content: center;
             flex-wrap: wrap;
-        }}
-        nav a {{
+        }
+        nav a {
             margin: 0 1rem;
             text-decoration: none;
             color: #495057;
@@ -209,32 +267,32 @@ def generate_html_head(title):
             padding: 0.5rem 1rem;
             border-radius: 5px;
             transition: all 0.3s ease;
-        }}
-        nav a:hover {{
+        }
+        nav a:hover {
             background-color: #007bff;
             color: white;
-        }}
-        nav .active {{
+        }
+        nav .active {
             background-color: #007bff;
             color: white;
-        }}
-        main {{
+        }
+        main {
             padding: 2rem;
-        }}
-        h1, h2, h3 {{
+        }
+        h1, h2, h3 {
             color: #000;
             margin-bottom: 1rem;
-        }}
-        h1 {{
+        }
+        h1 {
             font-size: 2rem;
             border-bottom: 3px solid #3498db;
             padding-bottom: 0.5rem;
-        }}
-        h2 {{
+        }
+        h2 {
             font-size: 1.5rem;
             margin-top: 2rem;
-        }}
-        .requirement {{
+        }
+        .requirement {
             background-color: #f8f9fa;
             border: 1px solid #dee2e6;
             border-left: 5px solid #dee2e6;
@@ -242,69 +300,69 @@ def generate_html_head(title):
             padding: 1.5rem;
             margin-bottom: 1.5rem;
             transition: transform 0.2s ease, box-shadow 0.2s ease;
-        }}
-        .requirement:hover {{
+        }
+        .requirement:hover {
             transform: translateY(-2px);
             box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        }}
-        .status-draft {{ border-left-color: #ffc107; }}
-        .status-in-progress {{ border-left-color: #17a2b8; }}
-        .status-in-review {{ border-left-color: #6c757d; }}
-        .status-finished {{ border-left-color: #28a745; }}
+        }
+        .status-draft { border-left-color: #ffc107; }
+        .status-in-progress { border-left-color: #17a2b8; }
+        .status-in-review { border-left-color: #6c757d; }
+        .status-finished { border-left-color: #28a745; }
         
-        .status-badge {{
+        .status-badge {
             padding: 0.2rem 0.6rem;
             border-radius: 20px;
             font-size: 0.85rem;
             font-weight: 600;
             display: inline-block;
             margin-left: 0.5rem;
-        }}
-        .badge-draft {{ background-color: #fff3cd; color: #856404; border: 1px solid #ffeeba; }}
-        .badge-in-progress {{ background-color: #d1ecf1; color: #0c5460; border: 1px solid #bee5eb; }}
-        .badge-in-review {{ background-color: #e2e3e5; color: #383d41; border: 1px solid #d6d8db; }}
-        .badge-finished {{ background-color: #d4edda; color: #155724; border: 1px solid #c3e6cb; }}
-        .requirement h3 {{
+        }
+        .badge-draft { background-color: #fff3cd; color: #856404; border: 1px solid #ffeeba; }
+        .badge-in-progress { background-color: #d1ecf1; color: #0c5460; border: 1px solid #bee5eb; }
+        .badge-in-review { background-color: #e2e3e5; color: #383d41; border: 1px solid #d6d8db; }
+        .badge-finished { background-color: #d4edda; color: #155724; border: 1px solid #c3e6cb; }
+        .requirement h3 {
             color: #495057;
             margin-bottom: 0.5rem;
-        }}
-        .requirement p {{
+        }
+        .requirement p {
             margin-bottom: 0.5rem;
-        }}
-        .diagram {{
+        }
+        .diagram {
             background-color: white;
             border: 1px solid #dee2e6;
             border-radius: 8px;
             padding: 1rem;
             margin-bottom: 2rem;
             text-align: center;
-        }}
-        .diagram svg {{
+        }
+        .diagram svg {
             max-width: 100%;
             height: auto;
-        }}
-        .puml-fallback {{
+        }
+        .puml-fallback {
             background-color: #f8f9fa;
             border: 1px solid #dee2e6;
             padding: 1rem;
             border-radius: 5px;
-        }}
-        pre {{
+        }
+        pre {
             background-color: #f8f9fa;
             border: 1px solid #dee2e6;
             border-radius: 5px;
             padding: 1rem;
             overflow-x: auto;
             white-space: pre-wrap;
-        }}
-        footer {{
+        }
+        footer {
             background-color: #343a40;
             color: white;
             text-align: center;
             padding: 1rem 0;
             margin-top: 2rem;
-        }}
-        .btn {{
+        }
+        .btn {
             display: inline-block;
             background-color: #007bff;
             color: white;
@@ -312,24 +370,24 @@ def generate_html_head(title):
             text-decoration: none;
             border-radius: 5px;
             transition: background-color 0.3s ease;
-        }}
-        .btn:hover {{
+        }
+        .btn:hover {
             background-color: #0056b3;
-        }}
-        @media (max-width: 768px) {{
-            header h1 {{
+        }
+        @media (max-width: 768px) {
+            header h1 {
                 font-size: 2rem;
-            }}
-            nav .nav-container {{
+            }
+            nav .nav-container {
                 flex-direction: column;
-            }}
-            nav a {{
+            }
+            nav a {
                 margin: 0.25rem 0;
-            }}
-            main {{
+            }
+            main {
                 padding: 1rem;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
@@ -340,10 +398,7 @@ def generate_html_head(title):
         </header>
 """
 
-
-def generate_html_footer():
-    """Generate HTML footer section."""
-    return """
+HTML_FOOTER = """
         <footer>
             <p>&copy; 2026 Project Documentation. Generated automatically.</p>
         </footer>
@@ -353,6 +408,17 @@ def generate_html_footer():
 """
 
 
+def generate_html_head(title):
+    """Generate HTML head section with improved styling."""
+    return HTML_HEAD_PREFIX + title + HTML_HEAD_SUFFIX
+
+
+def generate_html_footer():
+    """Generate HTML footer section."""
+    return HTML_FOOTER
+
+
+@lru_cache(maxsize=None)
 def generate_navigation(current_page):
     """Generate navigation menu."""
     pages = {
@@ -434,7 +500,20 @@ def generate_architecture_html(docs_path):
     return content
 
 
-def generate_single_diagram_page(docs_path, filename, title, page_slug):
+# Runtime, class and block pages differ only in title, filename and SVG,
+# so everything between those slots is assembled once at import time.
+DIAGRAM_PAGE_HEAD = HTML_HEAD_SUFFIX + "\n" + generate_navigation('architecture') + "\n<main>\n    <h1>"
+DIAGRAM_PAGE_BODY = """. Edit the PUML file and rebuild docs to refresh.</p>
+    <div class="diagram">
+        """
+DIAGRAM_PAGE_TAIL = """
+    </div>
+    <p style="text-align:center; margin-top:1rem;"><a class="btn" href="architecture.html">⬅ Back to Architecture Hub</a></p>
+</main>
+""" + HTML_FOOTER + "\n"
+
+
+def generate_single_diagram_page(docs_path, filename, title, page_slug, cache_dir=None):
     """Generate a dedicated page for one PlantUML diagram."""
     puml_path = docs_path / 'architecture' / filename
     puml_source = load_puml(puml_path)
@@ -445,22 +524,43 @@ def generate_single_diagram_page(docs_path, filename, title, page_slug):
     else:
         if "@startuml" not in puml_source or "@enduml" not in puml_source:
             log_warning(f"PUML file may be invalid (missing @startuml/@enduml): {puml_path}")
-        svg = render_puml_to_svg(puml_source)
+        svg = render_puml_to_svg(puml_source, cache_dir)
 
-    content = f"""
-{generate_html_head(title)}
-{generate_navigation('architecture')}
-<main>
-    <h1>{title}</h1>
-    <p>Rendered from {filename}. Edit the PUML file and rebuild docs to refresh.</p>
-    <div class="diagram">
-        {svg}
-    </div>
-    <p style="text-align:center; margin-top:1rem;"><a class="btn" href="architecture.html">⬅ Back to Architecture Hub</a></p>
-</main>
-{generate_html_footer()}
+    return (
+        "\n" + HTML_HEAD_PREFIX + title + DIAGRAM_PAGE_HEAD + title
+        + "</h1>\n    <p>Rendered from " + filename + DIAGRAM_PAGE_BODY + svg + DIAGRAM_PAGE_TAIL
+    )
+
+
+# Characters that must not reach the page unescaped from requirement YAML
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+
+def escape_html(value):
+    """Escape a requirement field for use in HTML text and double-quoted attributes."""
+    return str(value).translate(_HTML_ESCAPE_TABLE)
+
+
+# Card and badge CSS classes for the statuses allowed by validate_requirement_list
+STATUS_CLASSES = {
+    'draft': ('status-draft', 'badge-draft'),
+    'in progress': ('status-in-progress', 'badge-in-progress'),
+    'in review': ('status-in-review', 'badge-in-review'),
+    'finished': ('status-finished', 'badge-finished'),
+}
+
+# Leading markdown blockquote markers in requirement descriptions
+_BLOCKQUOTE_RE = re.compile(r'^> ', re.MULTILINE)
+
+# Opening of one requirement card; filled with %-formatting in the render loop
+REQUIREMENT_CARD = """
+    <div class="requirement %s" id="%s">
+        <h3>%s: %s</h3>
+        <p><strong>Status:</strong> <span class="status-badge %s">%s</span></p>
+        <p><strong>Refines:</strong> %s</p>
+        <p><strong>Description:</strong></p>
+        <p>%s</p>
 """
-    return content
 
 
 def generate_requirements_html(requirements_data, title, page_name, links=None):
@@ -481,54 +581,63 @@ def generate_requirements_html(requirements_data, title, page_name, links=None):
 """
         return content
 
-    content = f"""
+    parts = [f"""
 {generate_html_head(title)}
 {generate_navigation(page_name)}
 <main>
     <h1>{title}</h1>
     <p>This section contains all {title.lower()} with their current status and details.</p>
-"""
+"""]
 
     for req in requirements_data:
-        status = req.get('status', 'draft')
-        status_slug = status.lower().replace(' ', '-')
-        status_class = f"status-{status_slug}"
-        req_id = req['id']
+        status = escape_html(req.get('status', 'draft'))
+        status_classes = STATUS_CLASSES.get(status.lower())
+        if status_classes is None:
+            status_slug = status.lower().replace(' ', '-')
+            status_classes = (f"status-{status_slug}", f"badge-{status_slug}")
+        status_class, badge_class = status_classes
+        raw_id = req['id']
+        req_id = escape_html(raw_id)
         
         if page_name == 'software':
-            refines = req.get('refines', 'N/A')
-            refines_link = links.get(f"sw_{req_id}", "#")
-            if refines_link != "#":
-                refines = f'<a href="{refines_link}">{refines}</a>'
+            # Linked refines are pre-rendered while indexing in build_docs
+            refines = links.get(f"sw_{raw_id}") or escape_html(req.get('refines', 'N/A'))
         else:
-            refines = req.get('refines', 'N/A')
+            refines = escape_html(req.get('refines', 'N/A'))
         
-        content += f"""
-    <div class="requirement {status_class}" id="{req_id}">
-        <h3>{req_id}: {req['name']}</h3>
-        <p><strong>Status:</strong> <span class="status-badge badge-{status_slug}">{status}</span></p>
-        <p><strong>Refines:</strong> {refines}</p>
-        <p><strong>Description:</strong></p>
-        <p>{req.get('description', 'N/A').replace('> ', '').strip()}</p>
-"""
+        description = _BLOCKQUOTE_RE.sub('', req.get('description', 'N/A')).strip()
+        parts.append(REQUIREMENT_CARD % (
+            status_class, req_id, req_id, escape_html(req['name']),
+            badge_class, status, refines, escape_html(description),
+        ))
         
         # For high-level, add list of refining software requirements
         if page_name == 'high_level':
-            refining_links = links.get(f"hl_{req_id}", [])
+            refining_links = links.get(f"hl_{raw_id}", [])
             if refining_links:
-                content += "<p><strong>Refined by:</strong></p><ul>"
+                parts.append("<p><strong>Refined by:</strong></p><ul>")
                 for link in refining_links:
                     sw_id = link.split('#')[1]
-                    content += f'<li><a href="{link}">{sw_id}</a></li>'
-                content += "</ul>"
+                    parts.append(f'<li><a href="{link}">{sw_id}</a></li>')
+                parts.append("</ul>")
         
-        content += "</div>"
+        parts.append("</div>")
 
-    content += """
+    parts.append("""
 </main>
-"""
-    content += generate_html_footer()
-    return content
+""")
+    parts.append(generate_html_footer())
+    return "".join(parts)
+
+def write_if_changed(path, content):
+    """Write a generated page only if its bytes differ from what is already on disk."""
+    data = content.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
 
 
 def build_docs(docs_path):
@@ -546,68 +655,89 @@ def build_docs(docs_path):
     hl_req_path = docs_path / 'requirements/high_level_requirements.yaml'
     sw_req_path = docs_path / 'requirements/software_requirements.yaml'
 
-    hl_req_data = load_yaml(hl_req_path)
-    sw_req_data = load_yaml(sw_req_path)
-
-    # Validate YAML load results
-    if hl_req_data is None:
-        add_error(f"Could not load {hl_req_path}")
-    if sw_req_data is None:
-        add_error(f"Could not load {sw_req_path}")
-
-    # Validate requirement schema
-    hl_req_data = validate_requirement_list(
-        hl_req_data, "High-level", ["id", "name", "status", "description"], add_error
-    )
-    sw_req_data = validate_requirement_list(
-        sw_req_data, "Software", ["id", "name", "status", "refines", "description"], add_error
-    )
-
-    # Build links and detect dangling software requirements
-    links = {}
-    dangling_sw = []
-
-    if isinstance(hl_req_data, list) and isinstance(sw_req_data, list):
-        # Map high-level IDs
-        hl_ids = {req['id']: req for req in hl_req_data}
-        # For each software req, add link to high-level
-        for sw_req in sw_req_data:
-            refines = sw_req.get('refines')
-            if refines and refines in hl_ids:
-                links[f"sw_{sw_req['id']}"] = f"high_level.html#{refines}"
-            else:
-                dangling_sw.append(sw_req.get('id', '<unknown>'))
-
-        # For each high-level, find software that refines it
-        for hl_req in hl_req_data:
-            hl_id = hl_req['id']
-            refining_sw = [sw['id'] for sw in sw_req_data if sw.get('refines') == hl_id]
-            if refining_sw:
-                links[f"hl_{hl_id}"] = [f"software.html#{sw_id}" for sw_id in refining_sw]
-    else:
-        if not isinstance(hl_req_data, list):
-            add_error("High-level requirements YAML must be a list of entries.")
-        if not isinstance(sw_req_data, list):
-            add_error("Software requirements YAML must be a list of entries.")
-
-    # Generate pages
-    index_html = generate_index_html()
-    architecture_html = generate_architecture_html(docs_path)
-    runtime_html = generate_single_diagram_page(docs_path, 'runtime_diagram.puml', 'Runtime Diagram', 'runtime')
-    class_html = generate_single_diagram_page(docs_path, 'class_diagram.puml', 'Class Diagram', 'class')
-    block_html = generate_single_diagram_page(docs_path, 'block_diagram.puml', 'Block Diagram', 'block')
+    # Diagram pages wait on PlantUML requests and the YAML loads on disk, so start
+    # them together and assemble the requirement links while the renders are in flight
+    puml_cache = build_path / '.puml_cache'
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        runtime_future = executor.submit(
+            generate_single_diagram_page, docs_path, 'runtime_diagram.puml', 'Runtime Diagram', 'runtime', puml_cache
+        )
+        class_future = executor.submit(
+            generate_single_diagram_page, docs_path, 'class_diagram.puml', 'Class Diagram', 'class', puml_cache
+        )
+        block_future = executor.submit(
+            generate_single_diagram_page, docs_path, 'block_diagram.puml', 'Block Diagram', 'block', puml_cache
+        )
+        hl_req_future = executor.submit(load_yaml, hl_req_path)
+        sw_req_future = executor.submit(load_yaml, sw_req_path)
+        hl_req_data = hl_req_future.result()
+        sw_req_data = sw_req_future.result()
+
+        # Validate YAML load results
+        if hl_req_data is None:
+            add_error(f"Could not load {hl_req_path}")
+        if sw_req_data is None:
+            add_error(f"Could not load {sw_req_path}")
+
+        # Validate requirement schema
+        hl_req_data = validate_requirement_list(
+            hl_req_data, "High-level", ["id", "name", "status", "description"], add_error
+        )
+        sw_req_data = validate_requirement_list(
+            sw_req_data, "Software", ["id", "name", "status", "refines", "description"], add_error
+        )
 
-    high_level_html = generate_requirements_html(hl_req_data, "High-Level Requirements", 'high_level', links)
-    software_html = generate_requirements_html(sw_req_data, "Software Requirements", 'software', links)
+        # Build links and detect dangling software requirements
+        links = {}
+        dangling_sw = []
+
+        if isinstance(hl_req_data, list) and isinstance(sw_req_data, list):
+            # Map high-level IDs
+            hl_ids = {req['id']: req for req in hl_req_data}
+            # For each software req, add link to high-level and group it by the ID it refines
+            by_refines = defaultdict(list)
+            for sw_req in sw_req_data:
+                refines = sw_req.get('refines')
+                by_refines[refines].append(sw_req['id'])
+                if refines and refines in hl_ids:
+                    refines_html = escape_html(refines)
+                    links[f"sw_{sw_req['id']}"] = f'<a href="high_level.html#{refines_html}">{refines_html}</a>'
+                else:
+                    dangling_sw.append(sw_req.get('id', '<unknown>'))
+
+            # For each high-level, find software that refines it
+            for hl_req in hl_req_data:
+                hl_id = hl_req['id']
+                refining_sw = by_refines.get(hl_id)
+                if refining_sw:
+                    links[f"hl_{hl_id}"] = [f"software.html#{escape_html(sw_id)}" for sw_id in refining_sw]
+        else:
+            if not isinstance(hl_req_data, list):
+                add_error("High-level requirements YAML must be a list of entries.")
+            if not isinstance(sw_req_data, list):
+                add_error("Software requirements YAML must be a list of entries.")
+
+        # Generate pages
+        index_html = generate_index_html()
+        architecture_html = generate_architecture_html(docs_path)
+        high_level_html = generate_requirements_html(hl_req_data, "High-Level Requirements", 'high_level', links)
+        software_html = generate_requirements_html(sw_req_data, "Software Requirements", 'software', links)
+        runtime_html = runtime_future.result()
+        class_html = class_future.result()
+        block_html = block_future.result()
 
     # Write files
-    (build_path / 'index.html').write_text(index_html, encoding='utf-8')
-    (build_path / 'architecture.html').write_text(architecture_html, encoding='utf-8')
-    (build_path / 'runtime.html').write_text(runtime_html, encoding='utf-8')
-    (build_path / 'class.html').write_text(class_html, encoding='utf-8')
-    (build_path / 'block.html').write_text(block_html, encoding='utf-8')
-    (build_path / 'high_level.html').write_text(high_level_html, encoding='utf-8')
-    (build_path / 'software.html').write_text(software_html, encoding='utf-8')
+    pages = [
+        ('index.html', index_html),
+        ('architecture.html', architecture_html),
+        ('runtime.html', runtime_html),
+        ('class.html', class_html),
+        ('block.html', block_html),
+        ('high_level.html', high_level_html),
+        ('software.html', software_html),
+    ]
+    for name, html in pages:
+        write_if_changed(build_path / name, html)
 
     if dangling_sw:
         add_error(f"Dangling software requirements (no matching high-level refines): {', '.join(dangling_sw)}")
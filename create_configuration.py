@@ -3,13 +3,20 @@
 Interactive configuration creator/editor for project_setup.py.
 """
 
-import copy
 import json
+import mmap
+import os
 import re
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 CONFIGURATIONS_DIR = SCRIPT_DIR / "configurations"
@@ -17,137 +24,148 @@ OWNER_DIR = CONFIGURATIONS_DIR / "owner"
 USER_GENERATED_DIR = CONFIGURATIONS_DIR / "user_generated"
 INDEX_FILE = CONFIGURATIONS_DIR / "index.json"
 PLACEHOLDER_PATTERN = re.compile(r"\{([a-zA-Z0-9_]+)\}")
-ALLOWED_PLACEHOLDERS = {"lang", "lang_folder", "project_name"}
-ALLOWED_POST_PROCESS = {"none", "replace_first_heading_with_project_name"}
+ALLOWED_PLACEHOLDERS = frozenset({"lang", "lang_folder", "project_name"})
+ALLOWED_POST_PROCESS = frozenset({"none", "replace_first_heading_with_project_name"})
+ALLOWED_PLACEHOLDERS_TEXT = ", ".join(sorted(ALLOWED_PLACEHOLDERS))
+ALLOWED_POST_PROCESS_TEXT = ", ".join(sorted(ALLOWED_POST_PROCESS))
+PATH_SEPARATOR_TRANSLATION = str.maketrans({"\\": "/"})
+LANG_TO_FOLDER = {"en": "eng", "sr": "sr"}
+CONFIG_ID_TRANSLATION = str.maketrans({"-": "_", " ": "_"})
+CONFIG_ID_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+
+DEFAULT_FOLDERS = (
+    ".vscode",
+    "Automation",
+    "Docs",
+    "Docs/requirements",
+    "Docs/architecture",
+    "backend",
+    "frontend",
+)
+
+DEFAULT_FILES = (
+    {
+        "id": "vscode_settings",
+        "source": ".vscode/settings.json",
+        "target": ".vscode/settings.json",
+        "enabled": True,
+        "executable": False,
+        "post_process": "none",
+    },
+    {
+        "id": "docs_builder",
+        "source": "scripts/docs_builder.py",
+        "target": "Automation/docs_builder.py",
+        "enabled": True,
+        "executable": True,
+        "post_process": "none",
+    },
+    {
+        "id": "bootstrap_envs",
+        "source": "scripts/bootstrap_envs.sh",
+        "target": "Automation/bootstrap_envs.sh",
+        "enabled": True,
+        "executable": True,
+        "post_process": "none",
+    },
+    {
+        "id": "high_level_requirements",
+        "source": "docs/requirements/high_level_requirements.yaml",
+        "target": "Docs/requirements/high_level_requirements.yaml",
+        "enabled": True,
+        "executable": False,
+        "post_process": "none",
+    },
+    {
+        "id": "software_requirements",
+        "source": "docs/requirements/software_requirements.yaml",
+        "target": "Docs/requirements/software_requirements.yaml",
+        "enabled": True,
+        "executable": False,
+        "post_process": "none",
+    },
+    {
+        "id": "runtime_diagram",
+        "source": "docs/architecture/runtime_diagram.puml",
+        "target": "Docs/architecture/runtime_diagram.puml",
+        "enabled": True,
+        "executable": False,
+        "post_process": "none",
+    },
+    {
+        "id": "class_diagram",
+        "source": "docs/architecture/class_diagram.puml",
+        "target": "Docs/architecture/class_diagram.puml",
+        "enabled": True,
+        "executable": False,
+        "post_process": "none",
+    },
+    {
+        "id": "block_diagram",
+        "source": "docs/architecture/block_diagram.puml",
+        "target": "Docs/architecture/block_diagram.puml",
+        "enabled": True,
+        "executable": False,
+        "post_process": "none",
+    },
+    {
+        "id": "agents_md",
+        "source": "readmes/{lang_folder}/AGENTS.md",
+        "target": "AGENTS.md",
+        "enabled": True,
+        "executable": False,
+        "post_process": "none",
+    },
+    {
+        "id": "automation_readme",
+        "source": "readmes/{lang_folder}/README_Automation.md",
+        "target": "Automation/README.md",
+        "enabled": True,
+        "executable": False,
+        "post_process": "none",
+    },
+    {
+        "id": "root_readme",
+        "source": "readmes/{lang_folder}/README_root.md",
+        "target": "README.md",
+        "enabled": True,
+        "executable": False,
+        "post_process": "replace_first_heading_with_project_name",
+    },
+    {
+        "id": "root_gitignore",
+        "source": ".gitignore",
+        "target": ".gitignore",
+        "enabled": True,
+        "executable": False,
+        "post_process": "none",
+    },
+    {
+        "id": "setup_script",
+        "source": "scripts/setup.sh",
+        "target": "setup.sh",
+        "enabled": True,
+        "executable": True,
+        "post_process": "none",
+    },
+    {
+        "id": "start_script",
+        "source": "scripts/start.sh",
+        "target": "start.sh",
+        "enabled": True,
+        "executable": True,
+        "post_process": "none",
+    },
+)
 
 
 def default_folders():
-    return [
-        ".vscode",
-        "Automation",
-        "Docs",
-        "Docs/requirements",
-        "Docs/architecture",
-        "backend",
-        "frontend",
-    ]
+    return list(DEFAULT_FOLDERS)
 
 
 def default_files():
-    return [
-        {
-            "id": "vscode_settings",
-            "source": ".vscode/settings.json",
-            "target": ".vscode/settings.json",
-            "enabled": True,
-            "executable": False,
-            "post_process": "none",
-        },
-        {
-            "id": "docs_builder",
-            "source": "scripts/docs_builder.py",
-            "target": "Automation/docs_builder.py",
-            "enabled": True,
-            "executable": True,
-            "post_process": "none",
-        },
-        {
-            "id": "bootstrap_envs",
-            "source": "scripts/bootstrap_envs.sh",
-            "target": "Automation/bootstrap_envs.sh",
-            "enabled": True,
-            "executable": True,
-            "post_process": "none",
-        },
-        {
-            "id": "high_level_requirements",
-            "source": "docs/requirements/high_level_requirements.yaml",
-            "target": "Docs/requirements/high_level_requirements.yaml",
-            "enabled": True,
-            "executable": False,
-            "post_process": "none",
-        },
-        {
-            "id": "software_requirements",
-            "source": "docs/requirements/software_requirements.yaml",
-            "target": "Docs/requirements/software_requirements.yaml",
-            "enabled": True,
-            "executable": False,
-            "post_process": "none",
-        },
-        {
-            "id": "runtime_diagram",
-            "source": "docs/architecture/runtime_diagram.puml",
-            "target": "Docs/architecture/runtime_diagram.puml",
-            "enabled": True,
-            "executable": False,
-            "post_process": "none",
-        },
-        {
-            "id": "class_diagram",
-            "source": "docs/architecture/class_diagram.puml",
-            "target": "Docs/architecture/class_diagram.puml",
-            "enabled": True,
-            "executable": False,
-            "post_process": "none",
-        },
-        {
-            "id": "block_diagram",
-            "source": "docs/architecture/block_diagram.puml",
-            "target": "Docs/architecture/block_diagram.puml",
-            "enabled": True,
-            "executable": False,
-            "post_process": "none",
-        },
-        {
-            "id": "agents_md",
-            "source": "readmes/{lang_folder}/AGENTS.md",
-            "target": "AGENTS.md",
-            "enabled": True,
-            "executable": False,
-            "post_process": "none",
-        },
-        {
-            "id": "automation_readme",
-            "source": "readmes/{lang_folder}/README_Automation.md",
-            "target": "Automation/README.md",
-            "enabled": True,
-            "executable": False,
-            "post_process": "none",
-        },
-        {
-            "id": "root_readme",
-            "source": "readmes/{lang_folder}/README_root.md",
-            "target": "README.md",
-            "enabled": True,
-            "executable": False,
-            "post_process": "replace_first_heading_with_project_name",
-        },
-        {
-            "id": "root_gitignore",
-            "source": ".gitignore",
-            "target": ".gitignore",
-            "enabled": True,
-            "executable": False,
-            "post_process": "none",
-        },
-        {
-            "id": "setup_script",
-            "source": "scripts/setup.sh",
-            "target": "setup.sh",
-            "enabled": True,
-            "executable": True,
-            "post_process": "none",
-        },
-        {
-            "id": "start_script",
-            "source": "scripts/start.sh",
-            "target": "start.sh",
-            "enabled": True,
-            "executable": True,
-            "post_process": "none",
-        },
-    ]
+    return [dict(rule) for rule in DEFAULT_FILES]
 
 
 def default_runtime():
@@ -169,21 +187,53 @@ def fail(message: str) -> None:
     sys.exit(1)
 
 
+def dump_json_bytes(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    # Match orjson byte for byte: raw UTF-8, two-space indent, trailing newline.
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def parse_json_bytes(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def load_json_file(path: Path, label: str):
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        # The stdlib parser would copy a mapping into bytes anyway, so only orjson reads the mmap.
+        if orjson is None:
+            return parse_json_bytes(path.read_bytes())
+        with path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                fail(f"Invalid JSON in {label} '{path}': file is empty")
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return parse_json_bytes(view)
     except FileNotFoundError:
         fail(f"Missing {label}: {path}")
     except json.JSONDecodeError as exc:
         fail(f"Invalid JSON in {label} '{path}': {exc}")
 
 
-def write_json_file(path: Path, data) -> None:
+def write_bytes_atomic(path: Path, raw: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2)
-        handle.write("\n")
+    # A per-process name keeps concurrent runs apart and, unlike tempfile, keeps umask permissions.
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with temp_path.open("wb") as handle:
+            handle.write(raw)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_json_file(path: Path, data) -> None:
+    write_bytes_atomic(path, dump_json_bytes(data))
 
 
 def ensure_layout() -> None:
@@ -202,31 +252,49 @@ def ensure_layout() -> None:
         write_json_file(INDEX_FILE, initial)
 
 
+@lru_cache(maxsize=512)
 def normalize_config_id(raw_id: str) -> str:
-    value = raw_id.strip().lower().replace("-", "_").replace(" ", "_")
-    value = re.sub(r"[^a-z0-9_]", "", value)
-    value = re.sub(r"_+", "_", value).strip("_")
-    return value
+    chars = []
+    previous_underscore = False
+    for char in raw_id.strip().lower().translate(CONFIG_ID_TRANSLATION):
+        if char not in CONFIG_ID_CHARS:
+            continue
+        if char == "_":
+            if previous_underscore:
+                continue
+            previous_underscore = True
+        else:
+            previous_underscore = False
+        chars.append(char)
+    return "".join(chars).strip("_")
 
 
 def normalize_relative_path(raw_path: str, label: str) -> str:
-    value = raw_path.strip().replace("\\", "/").strip("/")
-    if not value:
+    parts = []
+    for part in raw_path.strip().translate(PATH_SEPARATOR_TRANSLATION).split("/"):
+        if not part:
+            continue
+        if not parts and part.startswith("~"):
+            fail(f"{label} must be relative, got '{raw_path}'.")
+        if part == "..":
+            fail(f"{label} contains invalid '..': '{raw_path}'.")
+        parts.append(part)
+    if not parts:
         fail(f"{label} cannot be empty.")
-    if value.startswith("/") or value.startswith("~"):
-        fail(f"{label} must be relative, got '{raw_path}'.")
-    parts = [part for part in value.split("/") if part]
-    if any(part == ".." for part in parts):
-        fail(f"{label} contains invalid '..': '{raw_path}'.")
-    return value
+    return "/".join(parts)
+
+
+@lru_cache(maxsize=512)
+def find_placeholders(value: str):
+    return tuple(PLACEHOLDER_PATTERN.findall(value))
 
 
 def validate_placeholders(value: str, label: str) -> None:
-    for placeholder in PLACEHOLDER_PATTERN.findall(value):
+    for placeholder in find_placeholders(value):
         if placeholder not in ALLOWED_PLACEHOLDERS:
             fail(
                 f"{label} uses unsupported placeholder '{{{placeholder}}}'. "
-                f"Allowed: {', '.join(sorted(ALLOWED_PLACEHOLDERS))}"
+                f"Allowed: {ALLOWED_PLACEHOLDERS_TEXT}"
             )
 
 
@@ -234,15 +302,11 @@ def normalize_folders(raw_folders):
     if not isinstance(raw_folders, list):
         fail("'folders' must be a list.")
     normalized = []
-    seen = set()
     for item in raw_folders:
         if not isinstance(item, str):
             fail("Every folder path must be a string.")
-        folder = normalize_relative_path(item, "Folder path")
-        if folder not in seen:
-            seen.add(folder)
-            normalized.append(folder)
-    return normalized
+        normalized.append(normalize_relative_path(item, "Folder path"))
+    return list(dict.fromkeys(normalized))
 
 
 def normalize_file_rule(raw_rule, index: int):
@@ -258,8 +322,8 @@ def normalize_file_rule(raw_rule, index: int):
     if not isinstance(target, str) or not target.strip():
         fail(f"File rule '{rule_id}' requires a non-empty string 'target'.")
 
-    source = source.strip().replace("\\", "/")
-    target = target.strip().replace("\\", "/")
+    source = source.strip().translate(PATH_SEPARATOR_TRANSLATION)
+    target = target.strip().translate(PATH_SEPARATOR_TRANSLATION)
     validate_placeholders(source, f"File rule '{rule_id}' source")
     validate_placeholders(target, f"File rule '{rule_id}' target")
 
@@ -274,7 +338,7 @@ def normalize_file_rule(raw_rule, index: int):
     if post_process not in ALLOWED_POST_PROCESS:
         fail(
             f"File rule '{rule_id}' uses unsupported post_process '{post_process}'. "
-            f"Allowed: {', '.join(sorted(ALLOWED_POST_PROCESS))}"
+            f"Allowed: {ALLOWED_POST_PROCESS_TEXT}"
         )
 
     return {
@@ -290,15 +354,37 @@ def normalize_file_rule(raw_rule, index: int):
 def normalize_files(raw_files):
     if not isinstance(raw_files, list):
         fail("'files' must be a list.")
-    normalized = []
+    normalized = [normalize_file_rule(item, index) for index, item in enumerate(raw_files)]
+    check_unique_rule_ids(normalized)
+    check_unique_targets(normalized)
+    return normalized
+
+
+def check_unique_rule_ids(rules) -> None:
     seen_ids = set()
-    for index, item in enumerate(raw_files):
-        rule = normalize_file_rule(item, index)
+    for rule in rules:
         if rule["id"] in seen_ids:
             fail(f"Duplicate file rule id '{rule['id']}'.")
         seen_ids.add(rule["id"])
-        normalized.append(rule)
-    return normalized
+
+
+def check_unique_targets(rules) -> None:
+    # Same check project_setup runs when loading configurations: enabled targets must not
+    # collide for any language. {project_name} stays literal, as braces never appear in paths.
+    for lang, lang_folder in LANG_TO_FOLDER.items():
+        seen_targets = set()
+        for rule in rules:
+            if not rule["enabled"]:
+                continue
+            target = (
+                rule["target"]
+                .replace("{lang_folder}", lang_folder)
+                .replace("{lang}", lang)
+                .strip("/")
+            )
+            if target in seen_targets:
+                fail(f"Duplicate generated target path '{target}' for language '{lang}'.")
+            seen_targets.add(target)
 
 
 def normalize_runtime(raw_runtime):
@@ -372,19 +458,21 @@ def load_registry():
 
 def load_configurations_from_registry(entries):
     configs = []
+    configurations_root = CONFIGURATIONS_DIR.resolve()
     for entry in entries:
         if not isinstance(entry, dict):
             fail("Index entry must be an object.")
-        config_id = str(entry.get("id", "")).strip()
-        rel_path = str(entry.get("path", "")).strip()
-        scope = str(entry.get("scope", "owner")).strip() or "owner"
+        get = entry.get
+        config_id = str(get("id", "")).strip()
+        rel_path = str(get("path", "")).strip()
+        scope = str(get("scope", "owner")).strip() or "owner"
         if not config_id or not rel_path:
             fail("Each index entry requires 'id' and 'path'.")
         if scope not in ("owner", "user_generated"):
             fail(f"Unsupported configuration scope '{scope}'.")
 
         config_path = (CONFIGURATIONS_DIR / rel_path).resolve()
-        if not str(config_path).startswith(str(CONFIGURATIONS_DIR.resolve())):
+        if not config_path.is_relative_to(configurations_root):
             fail(f"Configuration path escapes configurations/: {rel_path}")
         if not config_path.exists():
             fail(f"Missing configuration file from index: {config_path}")
@@ -403,33 +491,35 @@ def load_configurations_from_registry(entries):
 
 def prompt_yes_no(question: str, default: bool) -> bool:
     suffix = "[Y/n]" if default else "[y/N]"
-    raw = input(f"{question} {suffix}: ").strip().lower()
-    if not raw:
-        return default
-    if raw in {"y", "yes"}:
-        return True
-    if raw in {"n", "no"}:
-        return False
-    print("Invalid answer. Please enter y or n.")
-    return prompt_yes_no(question, default)
+    while True:
+        raw = input(f"{question} {suffix}: ").strip().lower()
+        if not raw:
+            return default
+        if raw in {"y", "yes"}:
+            return True
+        if raw in {"n", "no"}:
+            return False
+        print("Invalid answer. Please enter y or n.")
 
 
 def prompt_choice(question: str, options, default_index: int = 0) -> int:
     for index, option in enumerate(options, start=1):
         marker = " (default)" if index - 1 == default_index else ""
         print(f" {index}) {option}{marker}")
-    raw = input(f"{question} [default {default_index + 1}]: ").strip()
-    if not raw:
-        return default_index
-    try:
-        picked = int(raw) - 1
-    except ValueError:
-        print("Invalid input. Enter a number.")
-        return prompt_choice(question, options, default_index)
-    if picked < 0 or picked >= len(options):
-        print("Choice out of range.")
-        return prompt_choice(question, options, default_index)
-    return picked
+    prompt = f"{question} [default {default_index + 1}]: "
+    while True:
+        raw = input(prompt).strip()
+        if not raw:
+            return default_index
+        try:
+            picked = int(raw) - 1
+        except ValueError:
+            print("Invalid input. Enter a number.")
+            continue
+        if picked < 0 or picked >= len(options):
+            print("Choice out of range.")
+            continue
+        return picked
 
 
 def print_folder_list(folders):
@@ -509,7 +599,7 @@ def edit_folders_interactive(payload):
                 continue
             folder = normalize_relative_path(raw, "Folder path")
             payload["folders"][index] = folder
-            payload["folders"] = normalize_folders(payload["folders"])
+            payload["folders"] = list(dict.fromkeys(payload["folders"]))
             print("Folder updated.")
             continue
         if action == 3:
@@ -586,7 +676,7 @@ def edit_file_rule(payload):
 
     rule = normalize_file_rule(rule, index)
     payload["files"][index] = rule
-    payload["files"] = normalize_files(payload["files"])
+    check_unique_rule_ids(payload["files"])
     print("File rule updated.")
 
 
@@ -725,9 +815,19 @@ def pick_template_mode(owner_configs):
     return "template", owner_configs[picked]
 
 
+def clone_payload(template):
+    payload = dict(template)
+    payload["folders"] = list(template["folders"])
+    payload["files"] = [dict(rule) for rule in template["files"]]
+    payload["runtime"] = dict(template["runtime"])
+    payload["runtime"]["docs_packages"] = list(template["runtime"]["docs_packages"])
+    payload["behavior"] = dict(template["behavior"])
+    return payload
+
+
 def build_payload_from_mode(mode: str, template):
     if mode == "template":
-        payload = copy.deepcopy(template)
+        payload = clone_payload(template)
         payload.pop("_scope", None)
         payload.pop("_path", None)
         payload["template"] = template["id"]
@@ -756,15 +856,21 @@ def prompt_metadata(payload):
     payload["description"] = input("Description (optional): ").strip()
 
 
-def upsert_registry_entry(entries, config_id: str, scope: str, relative_path: str) -> None:
-    existing_index = None
+def index_registry_entries(entries):
+    entry_index = {}
     for idx, entry in enumerate(entries):
-        if str(entry.get("id", "")).strip() == config_id:
-            existing_index = idx
-            break
+        entry_index.setdefault(str(entry.get("id", "")).strip(), idx)
+    return entry_index
+
+
+def upsert_registry_entry(
+    entries, entry_index, config_id: str, scope: str, relative_path: str
+) -> None:
+    existing_index = entry_index.get(config_id)
 
     payload = {"id": config_id, "scope": scope, "path": relative_path}
     if existing_index is None:
+        entry_index[config_id] = len(entries)
         entries.append(payload)
         return
 
@@ -786,6 +892,8 @@ def main() -> None:
     ensure_layout()
     registry_data, entries = load_registry()
     all_configs = load_configurations_from_registry(entries)
+    # Entries are known to be objects only after the registry load has validated them.
+    entry_index = index_registry_entries(entries)
     owner_configs = [cfg for cfg in all_configs if cfg["_scope"] == "owner"]
 
     print("=== Configuration Creator ===")
@@ -819,9 +927,7 @@ def main() -> None:
     output_path = target_dir / f"{payload['id']}.json"
     relative_path = f"{relative_prefix}/{payload['id']}.json"
 
-    upsert_registry_entry(entries, payload["id"], scope, relative_path)
-    write_json_file(output_path, payload)
-
+    upsert_registry_entry(entries, entry_index, payload["id"], scope, relative_path)
     registry_data["configurations"] = sorted(
         entries,
         key=lambda entry: (
@@ -829,7 +935,13 @@ def main() -> None:
             str(entry.get("id", "")).lower(),
         ),
     )
-    write_json_file(INDEX_FILE, registry_data)
+
+    # Serialize both documents before touching disk so a serialization error cannot cause a
+    # partial write; each file is then replaced atomically, but separately.
+    config_bytes = dump_json_bytes(payload)
+    index_bytes = dump_json_bytes(registry_data)
+    write_bytes_atomic(output_path, config_bytes)
+    write_bytes_atomic(INDEX_FILE, index_bytes)
 
     print("\nConfiguration saved successfully.")
     print(f"- File: {output_path}")
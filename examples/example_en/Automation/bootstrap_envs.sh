@@ -15,6 +15,11 @@ echo "[2/2] Creating docs_venv at $AUTO_DIR/docs_venv"
 python3 -m venv "$AUTO_DIR/docs_venv"
 "$AUTO_DIR/docs_venv/bin/pip" install --upgrade pip >/dev/null
 "$AUTO_DIR/docs_venv/bin/pip" install pyyaml requests >/dev/null
+# docs_builder.py uses the libyaml C loader when PyYAML ships with it
+if ! "$AUTO_DIR/docs_venv/bin/python" -c 'import sys, yaml; sys.exit(not yaml.__with_libyaml__)'; then
+    echo "Note: PyYAML in docs_venv has no libyaml support; docs_builder.py falls back to the slower pure-Python loader."
+    echo "      Install libyaml (e.g. libyaml-dev) and run: $AUTO_DIR/docs_venv/bin/pip install --force-reinstall --no-binary pyyaml pyyaml"
+fi
 
 cat <<EOT
 
@@ -3,23 +3,61 @@
 Project setup script driven by artifacts/ templates and configuration JSON files.
 """
 
+import argparse
+import errno
 import json
 import os
 import re
 import shutil
+import stat
 import subprocess
 import sys
+import venv
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 ARTIFACTS_DIR = SCRIPT_DIR / "artifacts"
 CONFIGURATIONS_DIR = SCRIPT_DIR / "configurations"
 CONFIG_INDEX_FILE = CONFIGURATIONS_DIR / "index.json"
-LANG_TO_FOLDER = {"en": "eng", "sr": "sr"}
+LANG_TO_FOLDER = MappingProxyType({"en": "eng", "sr": "sr"})
+DEFAULT_LANGUAGE = "en"
 PLACEHOLDER_PATTERN = re.compile(r"\{([a-zA-Z0-9_]+)\}")
-ALLOWED_PLACEHOLDERS = {"lang", "lang_folder", "project_name"}
-ALLOWED_POST_PROCESS = {"none", "replace_first_heading_with_project_name"}
+ALLOWED_PLACEHOLDERS = frozenset({"lang", "lang_folder", "project_name"})
+ALLOWED_POST_PROCESS = frozenset({"none", "replace_first_heading_with_project_name"})
+ALLOWED_PLACEHOLDERS_TEXT = ", ".join(sorted(ALLOWED_PLACEHOLDERS))
+# Matches only placeholders outside ALLOWED_PLACEHOLDERS, so validation is a single search
+UNSUPPORTED_PLACEHOLDER_PATTERN = re.compile(
+    r"\{(?!(?:" + "|".join(map(re.escape, sorted(ALLOWED_PLACEHOLDERS))) + r")\})([a-zA-Z0-9_]+)\}"
+)
+ALLOWED_POST_PROCESS_TEXT = ", ".join(sorted(ALLOWED_POST_PROCESS))
+PATH_SEPARATOR_TRANSLATION = str.maketrans({"\\": "/"})
+PATH_COMPONENT_NAMES = frozenset({"", ".", ".."})
+# Keys accepted in an --answers file, mapped to the argparse destination types
+ANSWER_TYPES = MappingProxyType({
+    "target_dir": str,
+    "lang": str,
+    "name": str,
+    "config": str,
+    "venv": bool,
+    "git": bool,
+    "install_deps": bool,
+})
+CONFIG_READ_WORKERS = 8
+# Buffer for the user-space fallback copy (shutil defaults to 64 KiB)
+COPY_FALLBACK_BUFSIZE = 256 * 1024
+# copy_file_range errors that mean "not supported here" rather than a real I/O failure
+COPY_RANGE_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+)
 
 
 def default_runtime_settings():
@@ -44,54 +82,84 @@ def fail(message: str) -> None:
     sys.exit(1)
 
 
+def parse_json_bytes(raw: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_json_bytes(raw: bytes, path: Path, label: str):
+    """Parse JSON already read from path with a useful error if malformed."""
+    try:
+        return parse_json_bytes(raw)
+    except json.JSONDecodeError as exc:
+        fail(f"Invalid JSON in {label} '{path}': {exc}")
+
+
 def load_json_file(path: Path, label: str):
     """Load JSON file with a useful error if malformed."""
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        raw = path.read_bytes()
     except FileNotFoundError:
         fail(f"Missing {label}: {path}")
-    except json.JSONDecodeError as exc:
-        fail(f"Invalid JSON in {label} '{path}': {exc}")
+    return load_json_bytes(raw, path, label)
 
 
 def normalize_relative_path(raw_path: str, label: str) -> str:
     """Validate and normalize a relative path."""
-    normalized = raw_path.strip().replace("\\", "/").strip("/")
+    normalized = raw_path.strip().translate(PATH_SEPARATOR_TRANSLATION).strip("/")
     if not normalized:
         fail(f"{label} cannot be empty.")
     if normalized.startswith("/") or normalized.startswith("~"):
         fail(f"{label} must be relative, got '{raw_path}'.")
     parts = [part for part in normalized.split("/") if part]
-    if any(part == ".." for part in parts):
+    if ".." in parts:
         fail(f"{label} contains invalid relative traversal: '{raw_path}'.")
     return normalized
 
 
 def validate_placeholders(value: str, label: str) -> None:
     """Validate placeholders used in a template string."""
-    for placeholder in PLACEHOLDER_PATTERN.findall(value):
-        if placeholder not in ALLOWED_PLACEHOLDERS:
-            fail(
-                f"{label} uses unsupported placeholder '{{{placeholder}}}'. "
-                f"Allowed: {', '.join(sorted(ALLOWED_PLACEHOLDERS))}"
-            )
-
-
-def render_template_string(template: str, context: dict, label: str) -> str:
-    """Render known placeholders in template string."""
-    rendered = template
-    for key, value in context.items():
-        rendered = rendered.replace(f"{{{key}}}", str(value))
-    leftovers = PLACEHOLDER_PATTERN.findall(rendered)
-    if leftovers:
+    match = UNSUPPORTED_PLACEHOLDER_PATTERN.search(value)
+    if match:
         fail(
-            f"{label} still contains unresolved placeholders: "
-            + ", ".join(sorted({f'{{{item}}}' for item in leftovers}))
+            f"{label} uses unsupported placeholder '{{{match.group(1)}}}'. "
+            f"Allowed: {ALLOWED_PLACEHOLDERS_TEXT}"
         )
-    return rendered
 
 
+def compile_template(template: str) -> tuple:
+    """Split a validated template into (literal, placeholder) pairs."""
+    segments = []
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(template):
+        segments.append((template[position:match.start()], match.group(1)))
+        position = match.end()
+    segments.append((template[position:], None))
+    return tuple(segments)
+
+
+def render_template(segments: tuple, context: dict) -> str:
+    """Render a compiled template with plain dict lookups."""
+    return "".join(
+        literal if key is None else literal + str(context[key]) for literal, key in segments
+    )
+
+
+def path_context(context: dict, keys) -> dict:
+    """Return the given placeholder values, checked for use inside a relative path."""
+    values = {}
+    for key in keys:
+        value = str(context[key]).translate(PATH_SEPARATOR_TRANSLATION)
+        # Every component must be a real name: no empty parts from stray slashes, no "." or "..".
+        if value.startswith("~") or not PATH_COMPONENT_NAMES.isdisjoint(value.split("/")):
+            fail(f"Value '{context[key]}' for placeholder '{{{key}}}' cannot be used in a path.")
+        values[key] = value
+    return values
+
+
+@lru_cache(maxsize=None)
 def resolve_artifact(relative_path: str) -> Path:
     """Resolve artifact source path and fail if missing."""
     source = ARTIFACTS_DIR / relative_path
@@ -106,15 +174,11 @@ def normalize_folder_list(raw_folders, config_id: str):
         fail(f"Configuration '{config_id}' must define 'folders' as a list.")
 
     normalized = []
-    seen = set()
     for item in raw_folders:
         if not isinstance(item, str):
             fail(f"Configuration '{config_id}' has a non-string folder entry.")
-        folder = normalize_relative_path(item, f"Configuration '{config_id}' folder")
-        if folder not in seen:
-            seen.add(folder)
-            normalized.append(folder)
-    return normalized
+        normalized.append(normalize_relative_path(item, f"Configuration '{config_id}' folder"))
+    return tuple(dict.fromkeys(normalized))
 
 
 def normalize_file_rule(raw_rule, index: int, config_id: str):
@@ -134,10 +198,13 @@ def normalize_file_rule(raw_rule, index: int, config_id: str):
     if not isinstance(target, str) or not target.strip():
         fail(f"Configuration '{config_id}' file rule '{rule_id}' requires string 'target'.")
 
-    source_template = source.strip().replace("\\", "/")
-    target_template = target.strip().replace("\\", "/")
-    validate_placeholders(source_template, f"Configuration '{config_id}' file rule '{rule_id}' source")
-    validate_placeholders(target_template, f"Configuration '{config_id}' file rule '{rule_id}' target")
+    # Path structure is checked once on the template; apply_file_rules only checks substituted values.
+    source_label = f"Configuration '{config_id}' file rule '{rule_id}' source"
+    target_label = f"Configuration '{config_id}' file rule '{rule_id}' target"
+    source_template = normalize_relative_path(source, source_label)
+    target_template = normalize_relative_path(target, target_label)
+    validate_placeholders(source_template, source_label)
+    validate_placeholders(target_template, target_label)
 
     executable = raw_rule.get("executable", False)
     if not isinstance(executable, bool):
@@ -147,7 +214,7 @@ def normalize_file_rule(raw_rule, index: int, config_id: str):
     if post_process not in ALLOWED_POST_PROCESS:
         fail(
             f"Configuration '{config_id}' file rule '{rule_id}' uses unsupported post_process "
-            f"'{post_process}'."
+            f"'{post_process}'. Allowed: {ALLOWED_POST_PROCESS_TEXT}"
         )
 
     return {
@@ -155,6 +222,8 @@ def normalize_file_rule(raw_rule, index: int, config_id: str):
         "enabled": enabled,
         "source_template": source_template,
         "target_template": target_template,
+        "source_segments": compile_template(source_template),
+        "target_segments": compile_template(target_template),
         "executable": executable,
         "post_process": post_process,
     }
@@ -174,7 +243,23 @@ def normalize_file_rules(raw_rules, config_id: str):
         if normalized_rule["id"] in seen_ids:
             fail(f"Configuration '{config_id}' has duplicate file rule id '{normalized_rule['id']}'.")
         seen_ids.add(normalized_rule["id"])
-        normalized.append(normalized_rule)
+        # Disabled rules still get validated, but nothing downstream needs to see them.
+        if normalized_rule["enabled"]:
+            normalized.append(normalized_rule)
+
+    # Languages are a closed set, so duplicate targets can be caught here. {project_name}
+    # is left in place: braces cannot appear literally in a template, so it never collides.
+    for lang, lang_folder in LANG_TO_FOLDER.items():
+        bound = {"lang": lang, "lang_folder": lang_folder, "project_name": "{project_name}"}
+        seen_targets = set()
+        for rule in normalized:
+            target = render_template(rule["target_segments"], bound)
+            if target in seen_targets:
+                fail(
+                    f"Configuration '{config_id}' has duplicate generated target path "
+                    f"'{target}' for language '{lang}'."
+                )
+            seen_targets.add(target)
     return normalized
 
 
@@ -253,8 +338,13 @@ def load_available_configurations():
     if not isinstance(entries, list) or not entries:
         fail(f"{CONFIG_INDEX_FILE} must contain a non-empty 'configurations' list.")
 
-    available = []
-    seen_ids = set()
+    return load_configuration_entries(entries)
+
+
+def load_configuration_entries(entries):
+    """Load, validate and normalize the configuration files listed in the index."""
+    planned = []
+    configurations_root = CONFIGURATIONS_DIR.resolve()
     for entry in entries:
         if not isinstance(entry, dict):
             fail(f"{CONFIG_INDEX_FILE} has an invalid entry that is not an object.")
@@ -267,13 +357,26 @@ def load_available_configurations():
         if scope not in ("owner", "user_generated"):
             fail(f"Configuration '{ref_id}' has unsupported scope '{scope}'.")
 
+        # resolve() follows symlinks, so a link inside configurations/ cannot escape the tree.
         config_path = (CONFIGURATIONS_DIR / rel_path).resolve()
-        if not str(config_path).startswith(str(CONFIGURATIONS_DIR.resolve())):
+        if not config_path.is_relative_to(configurations_root):
             fail(f"Configuration '{ref_id}' points outside configurations/: {rel_path}")
         if not config_path.exists():
             fail(f"Configuration '{ref_id}' points to missing file: {config_path}")
+        planned.append((ref_id, rel_path, scope, config_path))
+
+    # Reads only wait on disk, so overlap them; parsing and validation stay on the main thread.
+    try:
+        with ThreadPoolExecutor(max_workers=CONFIG_READ_WORKERS) as executor:
+            raw_documents = list(executor.map(Path.read_bytes, [item[3] for item in planned]))
+    except FileNotFoundError as exc:
+        fail(f"Configuration file disappeared while loading: {exc.filename}")
 
-        config_data = load_json_file(config_path, f"configuration '{ref_id}'")
+    # Owner configurations are listed first, so keep one bucket per scope and sort each by name
+    by_scope = {"owner": [], "user_generated": []}
+    seen_ids = set()
+    for (ref_id, rel_path, scope, config_path), raw in zip(planned, raw_documents):
+        config_data = load_json_bytes(raw, config_path, f"configuration '{ref_id}'")
         file_id = str(config_data.get("id", "")).strip()
         if not file_id:
             fail(f"Configuration file '{config_path}' is missing 'id'.")
@@ -286,25 +389,26 @@ def load_available_configurations():
         normalized = normalize_configuration_data(config_data, file_id)
         normalized["scope"] = scope
         normalized["relative_path"] = rel_path
-        available.append(normalized)
+        by_scope[scope].append(normalized)
 
-    available.sort(key=lambda item: (0 if item["scope"] == "owner" else 1, item["name"].lower()))
-    return available
+    for bucket in by_scope.values():
+        bucket.sort(key=lambda item: item["name"].lower())
+    return by_scope["owner"] + by_scope["user_generated"]
 
 
-def choose_configuration(configurations):
+def choose_configuration(configurations, no_input: bool = False):
     """Prompt user to pick one of the available configurations."""
-    print("\nSelect project configuration:")
+    lines = ["", "Select project configuration:"]
     for index, config in enumerate(configurations, start=1):
         scope_label = "owner" if config["scope"] == "owner" else "user"
-        folder_count = len(config["folders"])
-        file_count = len(config["files"])
-        print(f" {index}) {config['name']} [{config['id']}] ({scope_label})")
-        print(f"    folders={folder_count}, file_rules={file_count}")
+        lines.append(f" {index}) {config['name']} [{config['id']}] ({scope_label})")
+        lines.append(f"    folders={len(config['folders'])}, file_rules={len(config['files'])}")
         if config["description"]:
-            print(f"    {config['description']}")
+            lines.append(f"    {config['description']}")
+    # Emit the whole menu in one write rather than a print per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    choice_raw = input(f"Choose 1-{len(configurations)} [1]: ").strip() or "1"
+    choice_raw = read_answer(f"Choose 1-{len(configurations)} [1]: ", no_input).strip() or "1"
     try:
         choice = int(choice_raw)
     except ValueError:
@@ -314,34 +418,120 @@ def choose_configuration(configurations):
     return configurations[choice - 1]
 
 
-def get_user_input(configurations):
+def parse_arguments(argv=None):
+    """Parse optional command-line answers; anything left unset is asked interactively."""
+    parser = argparse.ArgumentParser(
+        description="Create a project from artifacts and a selected configuration.",
+    )
+    parser.add_argument("--target-dir", help="directory in which the project folder is created")
+    parser.add_argument("--lang", choices=sorted(LANG_TO_FOLDER), help="project language")
+    parser.add_argument("--name", help="project name (also the project folder name)")
+    parser.add_argument("--config", help="configuration id from configurations/index.json")
+    parser.add_argument(
+        "--venv", action=argparse.BooleanOptionalAction, help="create root Python virtual environment"
+    )
+    parser.add_argument(
+        "--git", action=argparse.BooleanOptionalAction, help="initialize Git repository"
+    )
+    parser.add_argument(
+        "--install-deps", action=argparse.BooleanOptionalAction, help="install basic dependencies"
+    )
+    parser.add_argument(
+        "--answers",
+        help="JSON file with answers keyed like the options above (target_dir, lang, name, "
+        "config, venv, git, install_deps); command-line options take precedence",
+    )
+    parser.add_argument(
+        "--no-input",
+        action="store_true",
+        help="never prompt; unanswered questions take their default (project name is required)",
+    )
+    args = parser.parse_args(argv)
+    if args.answers is not None:
+        apply_answers_file(args, Path(args.answers))
+    return args
+
+
+def apply_answers_file(args, path: Path) -> None:
+    """Fill options left unset on the command line from a JSON answers file."""
+    answers = load_json_file(path, "answers file")
+    if not isinstance(answers, dict):
+        fail(f"Answers file '{path}' must contain a JSON object.")
+
+    unknown = sorted(set(answers) - set(ANSWER_TYPES))
+    if unknown:
+        fail(f"Answers file '{path}' has unknown keys: {', '.join(unknown)}")
+
+    for key, value in answers.items():
+        if not isinstance(value, ANSWER_TYPES[key]):
+            fail(f"Answers file '{path}' key '{key}' must be {ANSWER_TYPES[key].__name__}.")
+        if key == "lang" and value not in LANG_TO_FOLDER:
+            fail(f"Answers file '{path}' has unsupported lang '{value}'.")
+        if getattr(args, key) is None:
+            setattr(args, key, value)
+
+
+def read_answer(question: str, no_input: bool) -> str:
+    """Prompt for an answer; with prompts disabled, answer as if Enter was pressed."""
+    if no_input:
+        return ""
+    return input(question)
+
+
+def find_configuration(configurations, config_id: str):
+    """Return the configuration with the given id or fail."""
+    for config in configurations:
+        if config["id"] == config_id:
+            return config
+    fail(
+        f"Unknown configuration '{config_id}'. "
+        f"Available: {', '.join(config['id'] for config in configurations)}"
+    )
+
+
+def ask_yes_no(question: str, answer, no_input: bool = False) -> bool:
+    """Use the command-line answer if given, otherwise prompt with a y/n question."""
+    if answer is not None:
+        return answer
+    return read_answer(f"{question} (y/n): ", no_input).strip().lower() == "y"
+
+
+def get_user_input(configurations, args):
     """Collect user input for project creation."""
     print("=== Project Setup Script ===")
     print("This script creates a project from artifacts and selected configuration.\n")
 
-    target_dir = input("Target directory for the new project (default = current): ").strip()
+    target_dir = args.target_dir
+    if target_dir is None:
+        target_dir = read_answer(
+            "Target directory for the new project (default = current): ", args.no_input
+        ).strip()
     if not target_dir:
         target_dir = os.getcwd()
-    target_dir = os.path.abspath(os.path.expanduser(target_dir))
-    try:
-        Path(target_dir).mkdir(parents=True, exist_ok=True)
-    except Exception as exc:
-        fail(f"Cannot use target directory '{target_dir}': {exc}")
-
-    language = input("Choose language (en/sr) [en]: ").strip().lower() or "en"
-    if language not in ("en", "sr"):
-        language = "en"
-
-    project_name = input("Enter project name: ").strip()
+    target_dir = Path(os.path.abspath(os.path.expanduser(target_dir)))
+
+    language = args.lang
+    if language is None:
+        language = read_answer("Choose language (en/sr) [en]: ", args.no_input).strip().lower()
+        if language not in LANG_TO_FOLDER:
+            language = DEFAULT_LANGUAGE
+
+    project_name = args.name
+    if project_name is None:
+        project_name = read_answer("Enter project name: ", args.no_input)
+    project_name = project_name.strip()
     if not project_name:
         fail("Project name cannot be empty.")
 
-    selected_config = choose_configuration(configurations)
+    if args.config is not None:
+        selected_config = find_configuration(configurations, args.config)
+    else:
+        selected_config = choose_configuration(configurations, args.no_input)
 
-    create_venv = input("Create Python virtual environment? (y/n): ").strip().lower() == "y"
-    use_git = input("Initialize Git repository? (y/n): ").strip().lower() == "y"
-    install_deps = (
-        input("Install basic dependencies (Python pip, Node.js npm)? (y/n): ").strip().lower() == "y"
+    create_venv = ask_yes_no("Create Python virtual environment?", args.venv, args.no_input)
+    use_git = ask_yes_no("Initialize Git repository?", args.git, args.no_input)
+    install_deps = ask_yes_no(
+        "Install basic dependencies (Python pip, Node.js npm)?", args.install_deps, args.no_input
     )
 
     return {
@@ -355,83 +545,176 @@ def get_user_input(configurations):
     }
 
 
+def make_folders(root: str, folders) -> None:
+    """Create folders under root, shallowest first, with a single mkdir call per folder."""
+    # Parents always exist by the time a child is reached, so os.makedirs' per-level
+    # existence checks are unnecessary; every folder costs exactly one mkdir syscall.
+    for folder in sorted(folders, key=lambda item: item.count("/")):
+        path = os.path.join(root, folder)
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            # Only an existing directory counts as done; a file in the way is an error.
+            if not os.path.isdir(path):
+                raise
+
+
 def create_folders(project_path: Path, folders) -> None:
-    """Create folder structure from configuration."""
-    for folder in folders:
-        (project_path / folder).mkdir(parents=True, exist_ok=True)
+    """Create folder structure from configuration, including implied parent folders."""
+    make_folders(os.fspath(project_path), set(folders) | folders_containing(folders))
+
+
+def write_file_bytes(path: str, data: bytes) -> None:
+    """Overwrite a file with pre-encoded bytes using a single open/write/close."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
-def apply_post_process(target_path: Path, post_process: str, project_name: str) -> None:
-    """Apply optional post-processing transformation after file copy."""
+def apply_post_process(data: bytes, post_process: str, project_name: str) -> bytes:
+    """Return artifact content with the optional post-processing transformation applied."""
     if post_process == "none":
-        return
+        return data
 
     if post_process == "replace_first_heading_with_project_name":
-        content = target_path.read_text(encoding="utf-8")
-        lines = content.splitlines()
-        title = f"# {project_name}"
-        if lines and lines[0].startswith("# "):
-            lines[0] = title
-            target_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-        else:
-            target_path.write_text(f"{title}\n\n{content}", encoding="utf-8")
-        return
+        title = f"# {project_name}".encode("utf-8")
+        # Only the first line changes, so split once instead of tokenizing the whole file.
+        newline = data.find(b"\n")
+        first_line = data if newline < 0 else data[:newline]
+        if first_line.startswith(b"# "):
+            rest = b"" if newline < 0 else data[newline:]
+            if first_line.endswith(b"\r"):
+                rest = b"\r" + rest
+            if not rest.endswith(b"\n"):
+                rest += b"\n"
+            return title + rest
+        return title + b"\n\n" + data
 
     fail(f"Unsupported post_process '{post_process}'.")
 
 
-def apply_file_rules(project_path: Path, file_rules, context: dict):
-    """Apply file generation rules from configuration."""
-    generated_targets = []
-    seen_targets = set()
+def copy_file_fast(source: Path, target: str, executable: bool = False) -> None:
+    """Copy file data and permission bits, letting the kernel move the bytes when it can."""
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        src_stat = os.fstat(src.fileno())
+        copy_range = getattr(os, "copy_file_range", None)
+        remaining = src_stat.st_size
+        try:
+            while copy_range is not None and remaining > 0:
+                copied = copy_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError as exc:
+            if exc.errno not in COPY_RANGE_FALLBACK_ERRNOS:
+                raise
+        # The kernel copy advances both file offsets, so this only copies what is left.
+        shutil.copyfileobj(src, dst, COPY_FALLBACK_BUFSIZE)
+        mode = stat.S_IMODE(src_stat.st_mode)
+        os.chmod(target, mode | 0o111 if executable else mode)
+
+
+def copy_rule_target(source: Path, target: str, rule: dict, project_name: str) -> None:
+    """Copy one artifact into the project and apply the rule's file options."""
+    if rule["post_process"] == "none":
+        copy_file_fast(source, target, rule["executable"])
+        return
 
-    for rule in file_rules:
-        if not rule["enabled"]:
-            continue
+    # Transform in memory and write the result once, instead of copying and reading it back.
+    with open(source, "rb") as handle:
+        data = handle.read()
+        mode = stat.S_IMODE(os.fstat(handle.fileno()).st_mode)
+    write_file_bytes(target, apply_post_process(data, rule["post_process"], project_name))
+    os.chmod(target, mode | 0o111 if rule["executable"] else mode)
 
-        source_rel = render_template_string(
-            rule["source_template"], context, f"source for file rule '{rule['id']}'"
-        )
-        target_rel = render_template_string(
-            rule["target_template"], context, f"target for file rule '{rule['id']}'"
-        )
+
+def apply_file_rules(project_path: Path, file_rules, context: dict, existing_folders=()):
+    """Apply file generation rules from configuration."""
+    planned = []
+    # Templates were validated and normalized at load time; the substituted values are
+    # checked once per run rather than once per rule.
+    values = path_context(context, {
+        key
+        for rule in file_rules
+        for segments in (rule["source_segments"], rule["target_segments"])
+        for _, key in segments
+        if key is not None
+    })
+
+    # Resolve and validate every rule up front so nothing is copied for an invalid configuration.
+    for rule in file_rules:
+        # A value can still combine with neighbouring template text (e.g. "{project_name}."),
+        # so re-check each rendered path; that is one split per path.
         source_rel = normalize_relative_path(
-            source_rel, f"source path for file rule '{rule['id']}'"
+            render_template(rule["source_segments"], values),
+            f"source path for file rule '{rule['id']}'",
         )
         target_rel = normalize_relative_path(
-            target_rel, f"target path for file rule '{rule['id']}'"
+            render_template(rule["target_segments"], values),
+            f"target path for file rule '{rule['id']}'",
+        )
+        planned.append((rule, resolve_artifact(source_rel), target_rel))
+
+    # Duplicates were rejected at load time; only a project name equal to a literal path
+    # segment elsewhere can still make two targets meet.
+    if "project_name" in values:
+        targets = [target_rel for _, _, target_rel in planned]
+        if len(set(targets)) != len(targets):
+            duplicate = next(target for target in targets if targets.count(target) > 1)
+            fail(f"Configuration has duplicate generated target path: '{duplicate}'.")
+
+    # Create each missing target folder once, skipping folders create_folders already made.
+    # Target paths stay plain strings from here on; Path objects buy nothing in this loop.
+    project_root = os.fspath(project_path)
+    existing = set(existing_folders) | folders_containing(existing_folders)
+    missing = folders_containing(target_rel for _, _, target_rel in planned) - existing
+    make_folders(project_root, missing)
+
+    # Copy in rule order so errors and output are deterministic.
+    for rule, source, target_rel in planned:
+        copy_rule_target(
+            source, os.path.join(project_root, target_rel), rule, context["project_name"]
         )
 
-        if target_rel in seen_targets:
-            fail(f"Configuration has duplicate generated target path: '{target_rel}'.")
-        seen_targets.add(target_rel)
+    return [target_rel for _, _, target_rel in planned]
 
-        source = resolve_artifact(source_rel)
-        target = project_path / target_rel
-        target.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source, target)
-        if rule["executable"]:
-            target.chmod(target.stat().st_mode | 0o111)
-        apply_post_process(target, rule["post_process"], context["project_name"])
-        generated_targets.append(target_rel)
 
-    return generated_targets
+def folders_containing(relative_files) -> set:
+    """Return every folder (and ancestor folder) that holds one of the given relative files."""
+    populated = set()
+    for relative_file in relative_files:
+        folder = relative_file.rpartition("/")[0]
+        while folder and folder not in populated:
+            populated.add(folder)
+            folder = folder.rpartition("/")[0]
+    return populated
 
 
 def add_gitkeep_for_empty_folders(project_path: Path, folders) -> None:
     """Add .gitkeep only to folders that remained empty."""
+    project_root = os.fspath(project_path)
     for folder in folders:
-        folder_path = project_path / folder
-        if folder_path.exists() and folder_path.is_dir() and not any(folder_path.iterdir()):
-            (folder_path / ".gitkeep").touch()
+        folder_path = os.path.join(project_root, folder)
+        try:
+            with os.scandir(folder_path) as entries:
+                is_empty = next(entries, None) is None
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        if is_empty:
+            write_file_bytes(os.path.join(folder_path, ".gitkeep"), b"")
 
 
 def create_virtual_env(project_path: Path, create_venv: bool) -> None:
     """Create root Python virtual environment when requested."""
     if not create_venv:
         return
-    result = subprocess.run(["python3", "-m", "venv", "venv"], cwd=project_path, check=False)
-    if result.returncode != 0:
+    try:
+        venv.EnvBuilder(with_pip=True, symlinks=os.name != "nt").create(project_path / "venv")
+    except (OSError, subprocess.CalledProcessError):
         print("WARNING: Failed to create venv in project root.")
 
 
@@ -440,7 +723,17 @@ def install_dependencies(project_path: Path, install_deps: bool, generated_files
     if not install_deps:
         return
 
-    subprocess.run(["python3", "-m", "ensurepip", "--upgrade"], cwd=project_path, check=False)
+    # ensurepip's progress output is noise next to the other setup steps; keep only errors.
+    ensurepip = subprocess.run(
+        ["python3", "-m", "ensurepip", "--upgrade"],
+        cwd=project_path,
+        check=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if ensurepip.returncode != 0:
+        print(f"WARNING: ensurepip failed: {ensurepip.stderr.strip()}")
     print("Basic dependency installation requested.")
     if "setup.sh" in generated_files:
         print("Run './setup.sh' inside the new project to finish component-specific setup.")
@@ -473,8 +766,9 @@ def setup_docs_venv(project_path: Path, runtime_settings: dict) -> None:
     venv_path = project_path / venv_rel
     print(f"Setting up documentation build environment at '{venv_rel}'...")
 
-    create = subprocess.run(["python3", "-m", "venv", str(venv_path)], check=False)
-    if create.returncode != 0:
+    try:
+        venv.EnvBuilder(with_pip=True, symlinks=os.name != "nt").create(venv_path)
+    except (OSError, subprocess.CalledProcessError):
         print(f"WARNING: Failed to create docs venv at '{venv_rel}'.")
         return
 
@@ -483,24 +777,38 @@ def setup_docs_venv(project_path: Path, runtime_settings: dict) -> None:
         print("WARNING: docs venv created without pip executable.")
         return
 
-    for package in runtime_settings.get("docs_packages", []):
-        print(f"Installing {package} in docs venv...")
-        install = subprocess.run([str(pip_path), "install", package], check=False)
-        if install.returncode != 0:
+    packages = list(runtime_settings.get("docs_packages", []))
+    if not packages:
+        return
+
+    # One pip run resolves and downloads everything in a single session
+    pip_install = [str(pip_path), "install", "--no-input", "--disable-pip-version-check", "--quiet"]
+    print(f"Installing {', '.join(packages)} in docs venv...")
+    install = subprocess.run([*pip_install, *packages], check=False)
+    if install.returncode == 0:
+        return
+
+    # Retry one by one only on failure, to name the package that broke the install
+    for package in packages:
+        if subprocess.run([*pip_install, package], check=False).returncode != 0:
             print(f"WARNING: Failed to install {package} in docs venv.")
 
 
 def main() -> None:
+    args = parse_arguments()
     available_configurations = load_available_configurations()
-    config = get_user_input(available_configurations)
-
-    base_path = Path(config["target_dir"]).expanduser()
-    base_path.mkdir(parents=True, exist_ok=True)
+    config = get_user_input(available_configurations, args)
 
+    base_path = config["target_dir"]
     project_path = base_path / config["project_name"]
-    if project_path.exists():
+    # One mkdir creates the target directory as needed and refuses an existing project,
+    # with no separate existence check that could race with it.
+    try:
+        project_path.mkdir(parents=True)
+    except FileExistsError:
         fail(f"Directory '{config['project_name']}' already exists. Choose another project name.")
-    project_path.mkdir()
+    except OSError as exc:
+        fail(f"Cannot use target directory '{base_path}': {exc}")
 
     selected = config["selected_configuration"]
     folders = selected["folders"]
@@ -512,29 +820,45 @@ def main() -> None:
 
     context = {
         "lang": config["language"],
-        "lang_folder": LANG_TO_FOLDER.get(config["language"], "eng"),
+        "lang_folder": LANG_TO_FOLDER[config["language"]],
         "project_name": config["project_name"],
     }
-    generated_files = apply_file_rules(project_path, file_rules, context)
+    generated_files = apply_file_rules(project_path, file_rules, context, folders)
 
     if behavior.get("add_gitkeep_to_empty_folders", True):
-        add_gitkeep_for_empty_folders(project_path, folders)
+        # Folders that just received generated files cannot be empty, so skip probing them.
+        populated = folders_containing(generated_files)
+        add_gitkeep_for_empty_folders(
+            project_path, [folder for folder in folders if folder not in populated]
+        )
 
-    setup_docs_venv(project_path, runtime)
-    create_virtual_env(project_path, config["create_venv"])
-    install_dependencies(project_path, config["install_deps"], generated_files)
+    # The environment steps are separate subprocesses writing to disjoint locations, so
+    # overlap them; git runs last so its initial commit sees the finished tree.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        steps = [
+            executor.submit(setup_docs_venv, project_path, runtime),
+            executor.submit(create_virtual_env, project_path, config["create_venv"]),
+            executor.submit(
+                install_dependencies, project_path, config["install_deps"], generated_files
+            ),
+        ]
+        for step in steps:
+            step.result()
     initialize_git(project_path, config["use_git"])
 
-    print(f"\nProject '{config['project_name']}' created successfully!")
-    print(f"Configuration used: {selected['name']} ({selected['id']})")
-    print(f"Configuration file: configurations/{selected['relative_path']}")
-    print(f"Folders created: {len(folders)}")
-    print(f"Files generated: {len(generated_files)}")
-    print(f"Navigate to '{config['project_name']}' to get started.")
+    summary = [
+        f"\nProject '{config['project_name']}' created successfully!",
+        f"Configuration used: {selected['name']} ({selected['id']})",
+        f"Configuration file: configurations/{selected['relative_path']}",
+        f"Folders created: {len(folders)}",
+        f"Files generated: {len(generated_files)}",
+        f"Navigate to '{config['project_name']}' to get started.",
+    ]
     if config["create_venv"]:
-        print("Root virtual environment created in venv/.")
+        summary.append("Root virtual environment created in venv/.")
     if config["use_git"]:
-        print("Git repository initialized.")
+        summary.append("Git repository initialized.")
+    sys.stdout.write("\n".join(summary) + "\n")
 
 
 if __name__ == "__main__":